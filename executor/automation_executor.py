@@ -1,17 +1,183 @@
 import ast
+import functools
+import hashlib
+import io
 import json
+import logging
 import re
 import subprocess
+import sys
+import tarfile
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config.configuration as configuration
 
+logger = logging.getLogger(__name__)
+
+# orjson encodes the large evidence-laden Gemini payloads several times
+# faster than the stdlib; optional, with a transparent fallback
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+# Repo root is fixed for the process lifetime; resolve it once instead of
+# rebuilding the Path in every function that needs it
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """mkdir -p memoized per path: each call after the first is a dict hit
+    instead of a stat+mkdir syscall pair."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+# Shared session for the Gemini API and sheet exports: keep-alive amortizes
+# the TLS handshake across the checklist rows and the pool covers the
+# concurrent workers. Retry opts in to POST — generateContent is idempotent
+# for our use
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'POST'}),
+    ),
+))
+
+# UTF-8 box-drawing sequences that docker exec misdecodes; fixed in one
+# combined regex scan per line instead of five sequential str.replace passes
+_MOJIBAKE = {
+    'â""': '└',
+    'â"€': '─',
+    'Ã¢Å"â€¦': '✅',
+    'â€â€': '  ',
+    'â€â‚¬': '─',
+}
+_MOJIBAKE_RE = re.compile('|'.join(map(re.escape, _MOJIBAKE)))
+
+# Entrypoint log sections, detected with a single combined scan per line
+# (lastgroup names the marker) instead of five substring checks. End markers
+# come first in the alternation so they win over the start markers they
+# contain as substrings.
+SECTION_KEYS = ("commit_chain", "file_changes", "qp1_execution", "qp2_execution", "qp3_execution")
+_SECTION_RE = re.compile(
+    r'(?P<commit_chain_end>END OF COMMIT CHAIN HISTORY)'
+    r'|(?P<file_changes_end>END OF FILE CHANGES AND PII SUMMARY)'
+    r'|(?P<commit_chain>COMMIT CHAIN HISTORY)'
+    r'|(?P<file_changes>FILE CHANGES AND PII SUMMARY)'
+    r'|(?P<qp1_execution>QUERY POINT SET 1 - TEST COMMIT CHECK)'
+    r'|(?P<qp2_execution>QUERY POINT SET 2 - TEST COMMIT CHECK)'
+    r'|(?P<qp3_execution>QUERY POINT SET 3 - TEST COMMIT CHECK)'
+)
+
+
+# Gemini answer format, matched in one pass each over the response text
+# instead of splitting into lines and scanning them in Python
+_FOLLOWED_RE = re.compile(r'^\s*FOLLOWED:\s*(\S+)', re.M)
+_COMMENT_RE = re.compile(r'^\s*COMMENT:\s*(.+?)\s*$', re.M)
+
+# How long a downloaded sheet export stays fresh on disk
+_SHEET_CACHE_TTL = 300  # seconds
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_sheet_csv(sheet_id: str, gid: str) -> str:
+    """Return the path of a locally cached CSV export of one sheet tab.
+
+    The config and checklist tabs were re-downloaded from Google on every
+    invocation; the export now lands in a temp file reused until the TTL
+    expires, and the lru_cache skips even the freshness stat on repeat
+    calls within one process.
+    """
+    cache_file = Path(tempfile.gettempdir()) / f"chdc_sheet_{sheet_id}_{gid}.csv"
+    try:
+        if time.time() - cache_file.stat().st_mtime < _SHEET_CACHE_TTL:
+            return str(cache_file)
+    except OSError:
+        pass
+
+    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?gid={gid}&format=csv"
+    # Pooled session with gzip: pd.read_csv(url) opened a fresh uncompressed
+    # urllib connection per fetch
+    response = _HTTP_SESSION.get(url, headers={'Accept-Encoding': 'gzip, deflate'}, timeout=30)
+    response.raise_for_status()
+    cache_file.write_bytes(response.content)
+    return str(cache_file)
+
+
+def _load_sheet_df(gid) -> "pd.DataFrame":
+    """Read one sheet tab into a DataFrame via the on-disk cache."""
+    import pandas as pd
+
+    return pd.read_csv(_fetch_sheet_csv(configuration.SHEET_ID, str(gid)))
+
+
+# Concurrent Gemini calls; requests releases the GIL during I/O so threads
+# overlap the per-call network latency
+GEMINI_WORKERS = 8
+
+# Start-rate cap across those workers, replacing the old blanket sleep(1)
+# after every row
+GEMINI_QPS = 8
+
+_gemini_rate_lock = threading.Lock()
+_gemini_next_slot = 0.0
+
+
+def _pace_gemini_call():
+    """Reserve the next API start slot under GEMINI_QPS.
+
+    Each caller sleeps only until its reserved slot, so concurrent workers
+    stay busy instead of serializing on a fixed per-row delay.
+    """
+    global _gemini_next_slot
+    with _gemini_rate_lock:
+        now = time.monotonic()
+        slot = max(now, _gemini_next_slot)
+        _gemini_next_slot = slot + 1.0 / GEMINI_QPS
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _tar_sha256(tar_path: str) -> str:
+    """Streamed SHA-256 of an image tar, 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(tar_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_image_cache(cache_path: Path) -> Dict[str, str]:
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
 
 def run_cmd(cmd, capture_output=True, check=True, env=None):
     """Run a shell command and return stdout (decoded) and stderr."""
@@ -34,15 +200,22 @@ def show_loading(message="Loading Docker image", interval=2):
     """Display a loading message every few seconds until stopped."""
     stop_event = threading.Event()
 
+    # The animation is pointless in CI logs; skip the thread entirely when
+    # stdout (where the frames go) isn't a terminal so nothing contends
+    # with the worker threads
+    if not sys.stdout.isatty():
+        return stop_event
+
     def loader():
         dots = 0
-        while not stop_event.is_set():
+        # wait() blocks on a single condvar and returns True the moment the
+        # event is set, so stopping is instant instead of up to `interval` late
+        while not stop_event.wait(interval):
             print(f"\r{message}{'.' * (dots % 4)}", end='', flush=True)
             dots += 1
-            time.sleep(interval)
         print("\r", end='')  # clear line when done
 
-    thread = threading.Thread(target=loader)
+    thread = threading.Thread(target=loader, daemon=True)
     thread.start()
     return stop_event
 
@@ -68,40 +241,61 @@ def operation_docker(
         # ----------------------------
         # 1) Load Docker image
         # ----------------------------
-        stop_event = show_loading("[docker] Loading Docker image", interval=2)
-        try:
-            print(f"[docker] Loading image from: {docker_tar}")
-            p = subprocess.run(["docker", "load", "-i", docker_tar], capture_output=True, text=True, check=True)
-        finally:
-            # Stop loading animation
-            stop_event.set()
-
-        stdout = p.stdout or ""
-        print("[docker] load output:\n", stdout)
-
-        # Extract image reference
+        # Content-addressed skip: hashing a multi-GB tar is far cheaper than
+        # docker load, so when the same tar was loaded before and the image
+        # still exists locally, the load is skipped entirely
+        image_cache_path = PROJECT_ROOT / "output" / ".image_cache.json"
         image_ref = None
-        for line in stdout.splitlines():
-            if "Loaded image:" in line:
-                image_ref = line.split("Loaded image:", 1)[1].strip()
-                break
-        if not image_ref:
-            # fallback: use digest or most recent image
+        tar_sha = None
+        try:
+            tar_sha = _tar_sha256(docker_tar)
+            cached_ref = _load_image_cache(image_cache_path).get(tar_sha)
+            if cached_ref and subprocess.run(
+                    ["docker", "image", "inspect", cached_ref],
+                    capture_output=True, check=False).returncode == 0:
+                image_ref = cached_ref
+                print(f"[docker] Image already loaded, skipping docker load: {image_ref}")
+        except OSError:
+            pass
+
+        if image_ref is None:
+            stop_event = show_loading("[docker] Loading Docker image", interval=2)
+            try:
+                print(f"[docker] Loading image from: {docker_tar}")
+                # -q prints only the loaded reference, so there's no need to
+                # fall back to enumerating the whole image store (docker images
+                # recomputes per-image metadata and is expensive on busy hosts)
+                p = subprocess.run(["docker", "load", "-q", "-i", docker_tar], capture_output=True, text=True, check=True)
+            finally:
+                # Stop loading animation
+                stop_event.set()
+
+            stdout = (p.stdout or "").strip()
+            print("[docker] load output:\n", stdout)
+
+            # Extract image reference
             for line in stdout.splitlines():
-                if line.startswith("sha256:"):
-                    image_ref = line.strip()
+                line = line.strip()
+                if "Loaded image:" in line:
+                    image_ref = line.split("Loaded image:", 1)[1].strip()
                     break
-        if not image_ref:
-            images = subprocess.run(
-                ["docker", "images", "--format", "{{.Repository}}:{{.Tag}} {{.CreatedAt}}"],
-                capture_output=True, text=True
-            )
-            for l in (images.stdout or "").splitlines():
-                if "<none>" not in l:
-                    image_ref = l.split()[0]
+                if line.startswith(("sha256:", "Loaded image ID: sha256:")):
+                    image_ref = line.split("Loaded image ID:", 1)[-1].strip()
                     break
-        if not image_ref:
-            raise RuntimeError("Could not determine image reference after docker load")
+            if not image_ref and stdout and "\n" not in stdout:
+                # Some versions emit the bare reference under -q
+                image_ref = stdout
+            if not image_ref:
+                raise RuntimeError("Could not determine image reference after docker load")
+
+            if tar_sha:
+                try:
+                    cache = _load_image_cache(image_cache_path)
+                    cache[tar_sha] = image_ref
+                    _ensure_dir(image_cache_path.parent)
+                    image_cache_path.write_text(json.dumps(cache), encoding="utf-8")
+                except OSError:
+                    pass
 
         print(f"[docker] Image reference resolved to: {image_ref}")
 
@@ -127,11 +321,16 @@ def operation_docker(
         else:
             raise RuntimeError(f"Local git folder not found or invalid: {local_git_folder}")
 
-        project_root = Path(__file__).parent.parent
-        entrypoint_src = str(project_root / "entrypoint" / "entrypoint.sh")
+        entrypoint_src = str(PROJECT_ROOT / "entrypoint" / "entrypoint.sh")
 
-        subprocess.run(["docker", "cp", src_path, f"{container_id}:/app/"], check=True)
-        subprocess.run(["docker", "cp", entrypoint_src, f"{container_id}:/app/entrypoint.sh"], check=True)
+        # One tar stream on stdin instead of two docker cp invocations:
+        # halves the CLI fork/exec + dockerd round-trips for the copy phase
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w') as tf:
+            tf.add(src_path, arcname='.git')
+            tf.add(entrypoint_src, arcname='entrypoint.sh')
+        subprocess.run(["docker", "cp", "-", f"{container_id}:/app"],
+                       input=buf.getvalue(), check=True)
 
         # ----------------------------
         # 4) Execute entrypoint.sh
@@ -149,72 +348,86 @@ def operation_docker(
             "if [ ! -f /app/entrypoint.sh ]; then echo 'Error: entrypoint.sh not found' >&2; exit 128; fi;"
             "sed -i 's/\\r$//' /app/entrypoint.sh;"
             "chmod +x /app/entrypoint.sh;"
-            "bash /app/entrypoint.sh"
+            "bash /app/entrypoint.sh;"
+            # Patch presence is reported in-band instead of a separate
+            # docker exec test -d round-trip after the run
+            "[ -d /app/patch ] && echo __HAS_PATCH__ || true"
         )
         exec_cmd += [container_id, "/bin/bash", "-lc", bash_command]
 
         logs_path = Path(logs_outpath)
-        logs_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Section markers
-        SECTIONS = {
-            "commit_chain": ("COMMIT CHAIN HISTORY", "END OF COMMIT CHAIN HISTORY"),
-            "file_changes": ("FILE CHANGES AND PII SUMMARY", "END OF FILE CHANGES AND PII SUMMARY"),
-            "qp1_execution": ("QUERY POINT SET 1 - TEST COMMIT CHECK", None),
-            "qp2_execution": ("QUERY POINT SET 2 - TEST COMMIT CHECK", None),
-            "qp3_execution": ("QUERY POINT SET 3 - TEST COMMIT CHECK", None),
-        }
-
-        # Buffers
-        buffers = {k: [] for k in SECTIONS}
+        _ensure_dir(logs_path.parent)
+
+        # Section lines stream straight into their files as they're
+        # classified, so a multi-MB section costs O(1) memory instead of
+        # being buffered whole and joined at the end. Files open lazily so
+        # unseen sections still map to None below.
+        execution_dir = logs_path.parent / "execution"
+        _ensure_dir(execution_dir)
+        section_files = {}
+
+        def section_write(key, text):
+            f = section_files.get(key)
+            if f is None:
+                f = open(execution_dir / f"{key}.log", "w", encoding="utf-8")
+                section_files[key] = f
+            f.write(text + "\n")
 
         # Active section tracker
         active_section = None
+        has_patch = False
 
-        with open(logs_path, "w", encoding="utf-8") as lf:
-            proc = subprocess.Popen(
-                exec_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace"
-            )
+        try:
+            with open(logs_path, "w", encoding="utf-8") as lf:
+                # 64 KiB pipe buffer: the io layer does block reads from the
+                # pipe and splits lines in user space, instead of one read()
+                # syscall per chunk on entrypoint.sh's MB-scale output
+                proc = subprocess.Popen(
+                    exec_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    bufsize=65536
+                )
+
+                for line in iter(proc.stdout.readline, ''):
+                    if '__HAS_PATCH__' in line:
+                        has_patch = True
+                        continue  # marker only; keep it out of the logs
+                    line = _MOJIBAKE_RE.sub(lambda m: _MOJIBAKE[m.group(0)], line)
+                    lf.write(line)
+                    lf.flush()
+                    stripped_line = line.rstrip()
+
+                    # Section detection: one combined scan, dispatch on lastgroup
+                    m = _SECTION_RE.search(line)
+                    if m:
+                        key = m.lastgroup
+                        if key.endswith('_end'):
+                            key = key[:-4]
+                            section_write(key, stripped_line)
+                            if active_section == key:
+                                active_section = None
+                        else:
+                            active_section = key
+                            section_write(key, stripped_line)
+                    elif active_section:
+                        section_write(active_section, stripped_line)
+
+                ret = proc.wait()
+                if ret != 0:
+                    raise RuntimeError(f"entrypoint.sh returned non-zero exit: {ret}")
+        finally:
+            for f in section_files.values():
+                f.close()
 
-            for line in proc.stdout:
-                line = line.replace('â""', '└').replace('â"€', '─').replace('Ã¢Å"â€¦', '✅')
-                line = line.replace('â€â€', '  ').replace('â€â‚¬', '─')
-                lf.write(line)
-                lf.flush()
-                stripped_line = line.rstrip()
-
-                # Section detection
-                for key, (start_marker, end_marker) in SECTIONS.items():
-                    if start_marker in line:
-                        active_section = key
-                        buffers[key].append(stripped_line)
-                        break
-                    if end_marker and end_marker in line and active_section == key:
-                        buffers[key].append(stripped_line)
-                        active_section = None
-                        break
-                else:
-                    if active_section:
-                        buffers[active_section].append(stripped_line)
-
-            ret = proc.wait()
-            if ret != 0:
-                raise RuntimeError(f"entrypoint.sh returned non-zero exit: {ret}")
-
-        # Write individual section logs
+        # Record which section logs were produced
         log_files = {}
-        for key in SECTIONS:
-            buf = buffers[key]
-            if buf:
-                file_path = logs_path.parent / "execution" / f"{key}.log"
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write("\n".join(buf))
+        for key in SECTION_KEYS:
+            if key in section_files:
+                file_path = execution_dir / f"{key}.log"
                 log_files[key] = str(file_path)
                 print(f"✅ Created: {file_path}")
             else:
@@ -227,13 +440,11 @@ def operation_docker(
         # ----------------------------
         # 5) Copy patch folder (if exists)
         # ----------------------------
-        patch_dest = project_root / "output" / task_id / "patch"
-        patch_dest.mkdir(parents=True, exist_ok=True)
+        patch_dest = PROJECT_ROOT / "output" / task_id / "patch"
+        _ensure_dir(patch_dest)
         patch_dest_str = str(patch_dest)
 
-        check_cmd = ["docker", "exec", container_id, "test", "-d", "/app/patch"]
-        check_result = subprocess.run(check_cmd, check=False)
-        if check_result.returncode == 0:
+        if has_patch:
             subprocess.run(["docker", "cp", f"{container_id}:/app/patch/.", patch_dest_str], check=True)
             print(f"[docker] Patch copied to {patch_dest_str}")
         else:
@@ -243,9 +454,18 @@ def operation_docker(
         # 6) Cleanup
         # ----------------------------
         if not keep_container:
-            subprocess.run(["docker", "stop", container_id], check=False)
-            subprocess.run(["docker", "rm", container_id], check=False)
-            subprocess.run(["docker", "rmi", image_ref], check=False)
+            # stop must precede rm, but rm and rmi can overlap their dockerd
+            # round-trips; rmi is retried once in case it raced the rm
+            p_stop = subprocess.Popen(["docker", "stop", container_id])
+            try:
+                p_stop.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                p_stop.kill()
+            p_rm = subprocess.Popen(["docker", "rm", container_id])
+            p_rmi = subprocess.Popen(["docker", "rmi", image_ref])
+            p_rm.wait()
+            if p_rmi.wait() != 0:
+                subprocess.run(["docker", "rmi", image_ref], check=False)
             print("[docker] Container and image removed")
 
         print(f"[docker] Completed operation, logs written to: {logs_path}")
@@ -255,8 +475,8 @@ def operation_docker(
         print("[docker] ERROR:", e)
         if out["container_id"] and not keep_container:
             try:
-                subprocess.run(["docker", "stop", out["container_id"]], check=False)
-                subprocess.run(["docker", "rm", out["container_id"]], check=False)
+                # Single force-remove covers stop+rm in one dockerd call
+                subprocess.run(["docker", "rm", "-f", out["container_id"]], check=False)
             except:
                 pass
 
@@ -267,11 +487,12 @@ def operation_docker(
 
 def get_gemini_api_token():
     """Fetch llm api token from Google Sheets config."""
+    import pandas as pd
+
     configuration_df = pd.DataFrame()
 
     try:
-        url = f"https://docs.google.com/spreadsheets/d/{configuration.SHEET_ID}/export?gid={configuration.CONFIG_SHEET_NAME}&format=csv"
-        configuration_df = pd.read_csv(url)
+        configuration_df = _load_sheet_df(configuration.CONFIG_SHEET_NAME)
     except Exception as e:
         print(f"⚠️ Unexpected error while loading data from configuration sheet: {e}")
         return None
@@ -307,6 +528,9 @@ def operation_gemini_evaluate(
     """
     result = {"success": False, "error": None, "out_path": None}
 
+    # Deferred so docker-only runs never pay the pandas import
+    import pandas as pd
+
     try:
         print(f"[llm] Reading Review Checklist CSV")
         review_checklist_df = pd.DataFrame()
@@ -316,8 +540,7 @@ def operation_gemini_evaluate(
             return
 
         try:
-            url = f"https://docs.google.com/spreadsheets/d/{configuration.SHEET_ID}/export?gid={configuration.REVIEW_SHEET_NAME}&format=csv"
-            review_checklist_df = pd.read_csv(url)
+            review_checklist_df = _load_sheet_df(configuration.REVIEW_SHEET_NAME)
         except Exception as e:
             print(f"⚠️ Unexpected error while loading data from Review Checklist sheet: {e}")
 
@@ -336,25 +559,47 @@ def operation_gemini_evaluate(
         # Process each row
         total_rows = len(review_checklist_df)
         print(f"[llm] Processing {total_rows} checklist items...")
-        logs_path = ""
 
-        for idx, row in review_checklist_df.iterrows():
+        # Invariant across rows: read once instead of per iteration
+        query_point_2 = input_df.iloc[0].get("QP2 - Query Point".strip())
+        query_point_3 = input_df.iloc[0].get("QP3 - Query Point".strip())
+        task_id = input_df.iloc[0].get("Task_id".strip(), None)
+        logs_path = PROJECT_ROOT / "output" / str(task_id)
+
+        # Column-oriented access: pull each needed column out as a plain
+        # string list once, instead of boxing a Series per row via iterrows
+        cols = {
+            c: review_checklist_df[c].fillna('').astype(str).tolist()
+            if c in review_checklist_df.columns else [''] * total_rows
+            for c in ('Topics', 'CheckPoints', 'Input Cumulative', 'System Prompt')
+        }
+
+        # Results accumulate in plain lists and are assigned back in one
+        # shot at the end, avoiding a block-manager dispatch per cell
+        followed_out = review_checklist_df['Followed'].fillna('').tolist()
+        comments_out = review_checklist_df['LLM Comments'].fillna('').tolist()
 
-            query_point_2 = input_df.iloc[0].get("QP2 - Query Point".strip())
-            query_point_3 = input_df.iloc[0].get("QP3 - Query Point".strip())
+        # Collect every evaluable row first, then dispatch the API calls
+        # concurrently — the work is pure network I/O, so the wall clock
+        # drops from N*(latency + sleep) to roughly N*latency/workers
+        pending = []
 
-            if (pd.isna(query_point_2) or query_point_2 in ("N/A", "")) and idx >= 71:
+        qp2_missing = pd.isna(query_point_2) or query_point_2 in ("N/A", "")
+        qp3_missing = pd.isna(query_point_3) or query_point_3 in ("N/A", "")
+
+        for idx in range(total_rows):
+
+            if qp2_missing and idx >= 71:
                 break
 
-            if (pd.isna(query_point_3) or query_point_3 in ("N/A", "")) and idx >= 111:
+            if qp3_missing and idx >= 111:
                 break
 
             # Extract checkpoint information
-            topic = str(row.get('Topics', '')) if not pd.isna(row.get('Topics')) else ''
-            checkpoint = str(row.get('CheckPoints', '')) if not pd.isna(row.get('CheckPoints')) else ''
-            input_cumulative = str(row.get('Input Cumulative', '')) if not pd.isna(row.get('Input Cumulative')) else ''
-            system_prompt = str(row.get('System Prompt', '')) if not pd.isna(row.get('System Prompt')) else ''
-            print(f"[llm] Evaluating for {checkpoint}")
+            topic = cols['Topics'][idx]
+            checkpoint = cols['CheckPoints'][idx]
+            input_cumulative = cols['Input Cumulative'][idx]
+            system_prompt = cols['System Prompt'][idx]
 
             # Skip rows without checkpoints or system prompts
             if not checkpoint.strip() or not system_prompt.strip():
@@ -387,26 +632,28 @@ def operation_gemini_evaluate(
                         if isinstance(item, dict) and "field" in item and item["field"].strip()
                     ]
 
-            task_id = input_df.iloc[0].get("Task_id".strip(), None)
-            project_root = Path(__file__).parent.parent
-            logs_path = project_root / "output" / str(task_id)
-
             # Build checkpoint text
             checkpoint_text = f"Topic: {topic}\nCheckpoint: {checkpoint}"
+            pending.append((idx, system_prompt, checkpoint_text, input_data, checkpoint))
 
-            # Call Gemini API
-            evaluation = call_gemini_with_prompt(
+        def evaluate_row(system_prompt, checkpoint_text, input_data, checkpoint):
+            print(f"[llm] Evaluating for {checkpoint}")
+            _pace_gemini_call()
+            return call_gemini_with_prompt(
                 system_prompt=system_prompt,
                 checkpoint_text=checkpoint_text,
                 input_data=input_data,
                 api_key=gemini_api_key
             )
-            # Update the dataframe
-            review_checklist_df.at[idx, 'Followed'] = evaluation['followed']
-            review_checklist_df.at[idx, 'LLM Comments'] = evaluation['comment']
 
-            # Rate limiting - be polite to the API
-            time.sleep(1)
+        with ThreadPoolExecutor(max_workers=GEMINI_WORKERS) as pool:
+            futures = {pool.submit(evaluate_row, sp, ct, idata, cp): idx
+                       for idx, sp, ct, idata, cp in pending}
+            for future in as_completed(futures):
+                idx = futures[future]
+                evaluation = future.result()
+                followed_out[idx] = evaluation['followed']
+                comments_out[idx] = evaluation['comment']
 
         # Phase 2: Wait for Docker and process file-dependent rows
         if deferred_rows and docker_completed_event and logs_path:
@@ -415,14 +662,13 @@ def operation_gemini_evaluate(
             print("[llm] Docker execution completed now to evaluate for file-based input...")
 
             for idx in deferred_rows:
-                row = review_checklist_df.loc[idx]
-                system_prompt = str(row.get('System Prompt', ''))
-                checkpoint_text = f"Topic: {row.get('Topics', '')}\nCheckpoint: {row.get('CheckPoints', '')}"
+                system_prompt = cols['System Prompt'][idx]
+                checkpoint_text = f"Topic: {cols['Topics'][idx]}\nCheckpoint: {cols['CheckPoints'][idx]}"
                 print(f"[llm] Evaluating for {checkpoint_text}")
                 input_data = {}  # <- IMPORTANT: We now store MULTIPLE data sources
 
                 # Parse input_cumulative safely
-                input_cumulative = str(row.get('Input Cumulative', '')).strip()
+                input_cumulative = cols['Input Cumulative'][idx].strip()
                 if input_cumulative:
                     input_cumulative = re.sub(r'(\bfield\b|\bfield_type\b)\s*:', r'"\1":', input_cumulative)
                     try:
@@ -463,16 +709,20 @@ def operation_gemini_evaluate(
                             input_data[field_name] = None
 
                 evaluation = call_gemini_with_prompt(system_prompt, checkpoint_text, input_data, gemini_api_key)
-                review_checklist_df.at[idx, 'Followed'] = evaluation['followed']
-                review_checklist_df.at[idx, 'LLM Comments'] = evaluation['comment']
+                followed_out[idx] = evaluation['followed']
+                comments_out[idx] = evaluation['comment']
+
+        # Single bulk write-back for both phases
+        review_checklist_df['Followed'] = followed_out
+        review_checklist_df['LLM Comments'] = comments_out
 
         columns_to_remove = ["System Prompt", "Input Type", "Input", "Input Cumulative"]
         review_checklist_df = review_checklist_df.drop(columns=columns_to_remove, errors='ignore')
 
         # Save the updated CSV
-        out_checklist_path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(out_checklist_path)
         output_path = out_checklist_path / "llm" / "llm_evaluation.csv"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path.parent)
         review_checklist_df.to_csv(output_path, index=False)
 
         result["success"] = True
@@ -481,11 +731,11 @@ def operation_gemini_evaluate(
 
     except Exception as e:
         result["error"] = str(e)
-        print(f"[llm] ❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        # Single lazy-formatted logging call with the chained traceback,
+        # instead of the old in-function traceback import + print_exc
+        logger.exception("[llm] ❌ ERROR: %s", e)
 
-        return result
+    return result
 
 
 def call_gemini_with_prompt(system_prompt: str, checkpoint_text: str, input_data: str | dict[str, str | None],
@@ -560,10 +810,10 @@ The provided Input/Evidence can be text or drive link or combination of multiple
         }
 
         # Make the API call
-        response = requests.post(
+        response = _HTTP_SESSION.post(
             full_endpoint,
             headers=headers,
-            data=json.dumps(nl_data),
+            data=_json_dumps(nl_data),
             timeout=60
         )
 
@@ -571,7 +821,7 @@ The provided Input/Evidence can be text or drive link or combination of multiple
         response.raise_for_status()
 
         # Parse the JSON response
-        json_data = response.json()
+        json_data = _json_loads(response.content)
 
         # Extract response text
         response_text = ''
@@ -584,21 +834,12 @@ The provided Input/Evidence can be text or drive link or combination of multiple
             }
 
         # Parse the response
-        followed = "No"
-        comment = "Unable to parse LLM response"
-
-        lines = response_text.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('FOLLOWED:'):
-                followed_value = line.replace('FOLLOWED:', '').strip()
-                # Normalize to Yes/No
-                if followed_value.lower() in ['yes', 'y', 'true', 'pass']:
-                    followed = "Yes"
-                else:
-                    followed = "No"
-            elif line.startswith('COMMENT:'):
-                comment = line.replace('COMMENT:', '').strip()
+        followed_match = _FOLLOWED_RE.search(response_text)
+        # Normalize to Yes/No
+        followed = "Yes" if followed_match and followed_match.group(1).lower() in {'yes', 'y', 'true', 'pass'} else "No"
+
+        comment_match = _COMMENT_RE.search(response_text)
+        comment = comment_match.group(1) if comment_match else "Unable to parse LLM response"
 
         return {"followed": followed, "comment": comment}
 
@@ -622,10 +863,8 @@ The provided Input/Evidence can be text or drive link or combination of multiple
 # --------------------------- Overall Review ---------------------------
 
 def orchestrate(args):
-    project_root = Path(__file__).parent.parent
-
     # Path to entrypoint.sh
-    logs_dir = project_root / "output" / args.task_id
+    logs_dir = PROJECT_ROOT / "output" / args.task_id
 
     # Prepare entrypoint args - read commit vars from args (they may be blank strings)
     entrypoint_args = {
@@ -640,7 +879,6 @@ def orchestrate(args):
         "testTurnCommit3": args.testTurnCommit3 or "",
     }
 
-    project_root = Path(__file__).parent.parent
     docker_log_path = logs_dir / f"{args.task_id}_overall_log.txt"
     checklist_out_xlsx = logs_dir
 
@@ -651,17 +889,20 @@ def orchestrate(args):
     # Threads
     def t_docker():
         nonlocal docker_result
-        docker_result = operation_docker(
-            task_id=args.task_id,
-            docker_tar=args.docker_tar,
-            local_git_folder=args.local_git,
-            entrypoint_args=entrypoint_args,
-            run_command=args.runCommand or "",
-            logs_outpath=docker_log_path,
-            keep_container=False,
-        )
-
-    docker_done_event.set()  # Signal that Docker is done
+        try:
+            docker_result = operation_docker(
+                task_id=args.task_id,
+                docker_tar=args.docker_tar,
+                local_git_folder=args.local_git,
+                entrypoint_args=entrypoint_args,
+                run_command=args.runCommand or "",
+                logs_outpath=docker_log_path,
+                keep_container=False,
+            )
+        finally:
+            # Signal that Docker is done; set even on failure so the LLM
+            # phase's file-based rows never deadlock waiting on it
+            docker_done_event.set()
 
     def t_llm():
         nonlocal llm_result
@@ -686,9 +927,9 @@ def orchestrate(args):
         "docker": docker_result,
         "llm": llm_result,
     }
-    input_folder = project_root / "input" / str(args.task_id)
-    output_folder = project_root / "input" / str(args.task_id)
-    batches_folder = project_root / "batches"
+    input_folder = PROJECT_ROOT / "input" / str(args.task_id)
+    output_folder = PROJECT_ROOT / "input" / str(args.task_id)
+    batches_folder = PROJECT_ROOT / "batches"
     configuration.delete_folder(input_folder)
     configuration.delete_folder(batches_folder)
     print(f"Execution Results : '{output_folder}'")